@@ -0,0 +1,144 @@
+"""Logging configuration shared by the command line entry points.
+
+This module configures the root logger once, so importing or running
+several entry points in the same process does not attach duplicate
+handlers. Records are handed to a background listener through a queue,
+so logging threads never block on console I/O. The listener writes to a
+buffered copy of stderr, flushed on warnings or once per interval.
+"""
+
+import atexit
+import io
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+# Formatter shared by all console handlers
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Size of the stderr write buffer in bytes
+BUFFER_SIZE = 8192
+
+# Maximum seconds buffered records wait before being flushed
+FLUSH_INTERVAL = 1.0
+
+# Queue handler installed on the root logger by configure()
+_QUEUE_HANDLER: Optional[QueueHandler] = None
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """Stream handler that flushes on warnings or after an interval.
+
+    StreamHandler flushes after every record, which costs one write per
+    log line. Records are instead left in the stream buffer until a
+    warning or error is logged, or until a background thread flushes
+    the buffer at the end of the interval.
+    """
+
+    def __init__(self, stream, flush_interval: float = FLUSH_INTERVAL):
+        """Initialize the handler.
+
+        Args:
+            stream: Buffered text stream to write to
+            flush_interval (float): Maximum seconds between flushes
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="log-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self):
+        """Flush the stream once per interval until the handler closes."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, flushing only when required.
+
+        Args:
+            record (logging.LogRecord): Record to write
+        """
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """Stop the flush thread and close the handler."""
+        self._closed.set()
+        self.flush()
+        super().close()
+
+
+def _buffered_stderr():
+    """Open a buffered text stream on the stderr file descriptor.
+
+    Returns:
+        Any: Buffered stream, or sys.stderr if it has no file descriptor
+    """
+    try:
+        fd = sys.stderr.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return sys.stderr
+
+    # closefd=False keeps stderr open when the stream is collected
+    return os.fdopen(
+        fd,
+        'w',
+        buffering=BUFFER_SIZE,
+        encoding=sys.stderr.encoding or 'utf-8',
+        errors='backslashreplace',
+        closefd=False
+    )
+
+
+def configure(level: int = logging.INFO):
+    """Configure the root logger with a queued console handler.
+
+    Calling this more than once does not add another handler. Handlers
+    attached by the caller, e.g. a FileHandler, are left in place.
+
+    Args:
+        level (int): Root logger level
+    """
+    global _QUEUE_HANDLER
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    if _QUEUE_HANDLER in root_logger.handlers:
+        return
+
+    # Create console handler, driven by the listener thread
+    console_handler = _BufferedStreamHandler(_buffered_stderr())
+    console_handler.setFormatter(_FORMATTER)
+
+    # Callers only enqueue records, the listener writes them out
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    # Flush queued records on interpreter shutdown, handlers run in
+    # reverse order so the listener is drained before the buffer flush
+    atexit.register(console_handler.flush)
+    atexit.register(listener.stop)
+
+    _QUEUE_HANDLER = QueueHandler(log_queue)
+    root_logger.addHandler(_QUEUE_HANDLER)
@@ -7,11 +7,45 @@ exceed certain thresholds.
 import logging
 import requests
 from datetime import datetime
+from typing import Any, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Alert title shown in the Lark/Feishu post message
+ALERT_TITLE = "[重点关注]云平台账单消费提醒"
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session for webhook requests.
+
+    Returns:
+        requests.Session: Session with keep-alive connection pooling
+    """
+    session = requests.Session()
+    # Only connection failures are retried. urllib3 never retries POST
+    # on error statuses or read errors by default, which avoids sending
+    # an alert twice when the webhook already accepted it
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session so repeated alerts reuse TCP and TLS connections
+_SESSION = _create_session()
+
 
 class AlertService:
     """Service for sending billing alerts."""
@@ -23,6 +57,41 @@ class AlertService:
             webhook_url (str): Webhook URL for sending alerts
         """
         self.webhook_url = webhook_url
+        self._async_client = None
+
+        # Message template built once, only the text node varies per call
+        self._template = {
+            "msg_type": "post",
+            "content": {
+                "post": {
+                    "zh_cn": {
+                        "title": ALERT_TITLE,
+                        "content": [[
+                            {"tag": "text", "text": ""},
+                            {"tag": "at", "user_id": "all"}
+                        ]]
+                    }
+                }
+            }
+        }
+        self._text_node = (
+            self._template["content"]["post"]["zh_cn"]["content"][0][0]
+        )
+
+    def _build_message(self, alert_message: str) -> Dict[str, Any]:
+        """Fill the message template with an alert.
+
+        The returned template is serialized by the HTTP client before
+        the next alert is filled in.
+
+        Args:
+            alert_message (str): Alert message
+
+        Returns:
+            Dict[str, Any]: Webhook request payload
+        """
+        self._text_node["text"] = alert_message
+        return self._template
 
     def send_alert(
         self,
@@ -37,46 +106,75 @@ class AlertService:
             bool: True if alert was sent successfully, False otherwise
         """
         try:
-            # Calculate cost increase percentage
-            # Prepare alert message
-            message = {
-                "msg_type": "post",
-                "content": {
-                    "post": {
-                        "zh_cn": {
-                            "title": "[重点关注]云平台账单消费提醒",
-                            "content": [
-                                [{
-                                    "tag": "text",
-                                    "text": alert_message
-                                }, {
-                                    "tag": "at",
-                                    "user_id": "all"
-                                }]
-                            ]
-                        }
-                    }
-                }
-            }
+            message = self._build_message(alert_message)
 
-            # Send webhook request
-            response = requests.post(
+            # Send webhook request through the pooled session
+            response = _SESSION.post(
                 self.webhook_url,
                 json=message,
                 headers={'Content-Type': 'application/json'},
                 timeout=10
             )
-            logger.info(f"response: {response.json()}")
+            logger.info("response: %s", response.json())
 
             response.raise_for_status()
 
-            logger.info(
-                f"Alert sent successfully: {alert_message}"
-            )
+            logger.info("Alert sent successfully: %s", alert_message)
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(
-                f"Failed to send alert: {str(e)}"
+            logger.error("Failed to send alert: %s", e)
+            return False
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Get the cached asynchronous HTTP client.
+
+        Returns:
+            httpx.AsyncClient: Client with keep-alive connections
+
+        Raises:
+            RuntimeError: If httpx is not installed
+        """
+        if httpx is None:
+            raise RuntimeError(
+                "httpx is required for asynchronous alerts. Install it "
+                "with 'pip install cloud-billings[async]'."
             )
-            return False
\ No newline at end of file
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=5)
+            )
+        return self._async_client
+
+    async def send_alert_async(self, alert_message: str) -> bool:
+        """Send alert without blocking the event loop.
+
+        Args:
+            alert_message (str): Alert message
+
+        Returns:
+            bool: True if alert was sent successfully, False otherwise
+        """
+        client = self._get_async_client()
+        try:
+            message = self._build_message(alert_message)
+            response = await client.post(self.webhook_url, json=message)
+            response.raise_for_status()
+            logger.info("response: %s", response.json())
+
+            logger.info("Alert sent successfully: %s", alert_message)
+            return True
+
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError covers response bodies that are not JSON
+            logger.error("Failed to send alert: %s", e)
+            return False
+
+    async def aclose(self):
+        """Close the asynchronous HTTP client if it was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -1,6 +1,11 @@
+import re
 from typing import Dict
 
 
+# Matches one key=value item, items without '=' are skipped
+_ITEM_PATTERN = re.compile(r'\s*([^=|]+?)\s*=\s*([^|]*?)\s*(?:\||$)')
+
+
 class ConfigParser:
     """
     Parser for configuration strings in format: key1=value1|key2=value2
@@ -19,15 +24,7 @@ class ConfigParser:
         if not config_str:
             return {}
 
-        config = {}
-        items = config_str.split('|')
-        for item in items:
-            if '=' not in item:
-                continue
-            key, value = item.split('=', 1)
-            config[key.strip()] = value.strip()
-
-        return config
+        return dict(_ITEM_PATTERN.findall(config_str))
 
     @staticmethod
     def format(config: Dict[str, str]) -> str:
@@ -40,4 +37,4 @@ class ConfigParser:
         Returns:
             Configuration string in format key1=value1|key2=value2
         """
-        return '|'.join(f"{k}={v}" for k, v in config.items())
\ No newline at end of file
+        return '|'.join(map('{0[0]}={0[1]}'.format, config.items()))
\ No newline at end of file
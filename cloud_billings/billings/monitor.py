@@ -8,10 +8,18 @@ import logging
 import csv
 import os
 import json
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
 
-from cloud_billings.clouds.service import BillingService
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from cloud_billings.clouds.service import BillingService, ProviderFactory
 from cloud_billings.billings.alert_service import AlertService
 from cloud_billings.billings.config_parser import ConfigParser
 
@@ -19,6 +27,74 @@ from cloud_billings.billings.config_parser import ConfigParser
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound of providers fetched concurrently
+MAX_FETCH_WORKERS = 16
+
+# Configuration columns used by the monitor, in provider tuple order
+CONFIG_COLUMNS = ('name', 'display_name', 'provider', 'config')
+
+
+def _read_json_file(path: str) -> Dict[str, Any]:
+    """Read a JSON file, using orjson when it is available.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        Dict[str, Any]: Parsed data
+    """
+    if orjson is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _write_json_file(path: str, data: Dict[str, Any]):
+    """Write data as indented JSON, using orjson when it is available.
+
+    Args:
+        path (str): Path to the JSON file
+        data (Dict[str, Any]): Data to write
+    """
+    if orjson is None:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        return
+
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_json_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load a billing file, parsing each file version only once.
+
+    The modification time is part of the cache key so a rewritten file
+    is parsed again.
+
+    Args:
+        path (str): Path to the JSON file
+        mtime_ns (int): Modification time of the file in nanoseconds
+
+    Returns:
+        Dict[str, Any]: Parsed billing data
+    """
+    return _read_json_file(path)
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """Load a billing file through the parsed file cache.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        Dict[str, Any]: Parsed billing data
+    """
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
 
 class BillingMonitor:
     """Monitor for cloud billing costs."""
@@ -43,13 +119,30 @@ class BillingMonitor:
         self.webhook_url = webhook_url
         self.cost_threshold = cost_threshold
         self.growth_threshold = growth_threshold
+        self._alert_service = (
+            AlertService(webhook_url) if webhook_url else None
+        )
+        # Billing files read or written during the current run
+        self._file_cache: Dict[str, Dict[str, Any]] = {}
+        self._update_run_timestamps()
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
         """Ensure data directory exists."""
-        if not os.path.exists(self.data_dir):
+        try:
             os.makedirs(self.data_dir)
             logger.info(f"Created data directory: {self.data_dir}")
+        except FileExistsError:
+            pass
+
+    def _update_run_timestamps(self):
+        """Compute the timestamps shared by all providers of a run."""
+        now = datetime.now()
+        self._run_hour = now.strftime("%Y-%m-%d-%H")
+        self._prev_hour = (now - timedelta(hours=1)).strftime(
+            "%Y-%m-%d-%H"
+        )
+        self._current_month = now.strftime("%Y-%m")
 
     def _get_current_hour_file(self, provider_name: str) -> str:
         """Get filename for current hour.
@@ -60,8 +153,33 @@ class BillingMonitor:
         Returns:
             str: Current hour's filename
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H")
-        return f"{provider_name}_{timestamp}.json"
+        return f"{provider_name}_{self._run_hour}.json"
+
+    def _read_json(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read a billing file through the per-run file cache.
+
+        Args:
+            path (str): Path to the billing file
+
+        Returns:
+            Optional[Dict[str, Any]]: Billing data if the file exists
+        """
+        data = self._file_cache.get(path)
+        if data is not None:
+            return data
+
+        # The stat call of the parse cache doubles as the existence check
+        try:
+            data = _load_json(path)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            # Unreadable files, e.g. NaN written by older versions
+            logger.warning("Ignoring invalid billing file %s: %s", path, e)
+            return None
+
+        self._file_cache[path] = data
+        return data
 
     def _get_billing_data(
         self, 
@@ -77,13 +195,12 @@ class BillingMonitor:
         """
         current_file = self._get_current_hour_file(provider_name)
         file_path = os.path.join(self.data_dir, current_file)
-        
-        if os.path.exists(file_path):
+
+        data = self._read_json(file_path)
+        if data is not None:
             msg = f"Using cached data for {provider_name} from {current_file}"
             logger.info(msg)
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        return None
+        return data
 
     def _save_billing_data(
         self, 
@@ -99,8 +216,12 @@ class BillingMonitor:
         filename = self._get_current_hour_file(provider_name)
         filepath = os.path.join(self.data_dir, filename)
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Store the cost as float so comparisons use plain float math,
+        # non-finite costs are stored as null to keep the file valid JSON
+        total_cost = float(data['total_cost'])
+        data['total_cost'] = total_cost if math.isfinite(total_cost) else None
+        _write_json_file(filepath, data)
+        self._file_cache[filepath] = data
 
         logger.info(f"Saved billing data to {filepath}")
 
@@ -116,33 +237,28 @@ class BillingMonitor:
         Returns:
             Optional[Dict[str, Any]]: Previous billing data if exists
         """
-        # Get previous hour's timestamp
-        previous_hour = datetime.now() - timedelta(hours=1)
-        previous_hour_file = (
-            f"{provider_name}_{previous_hour.strftime('%Y-%m-%d-%H')}.json"
-        )
+        previous_hour_file = f"{provider_name}_{self._prev_hour}.json"
         
         previous_file_path = os.path.join(self.data_dir, previous_hour_file)
-        if not os.path.exists(previous_file_path):
-            return None
-
-        with open(previous_file_path, 'r') as f:
-            return json.load(f)
+        return self._read_json(previous_file_path)
 
     def _fetch_and_save_billing(
-        self, 
-        provider: Dict[str, str]
+        self,
+        provider_name: str,
+        provider_type: str,
+        config_str: str
     ) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Fetch and save billing data for a provider.
 
         Args:
-            provider (Dict[str, str]): Provider configuration
+            provider_name (str): Name of the configured provider
+            provider_type (str): Cloud provider type, e.g. aws
+            config_str (str): Provider configuration string
 
         Returns:
             Tuple[str, Optional[Dict[str, Any]]]: Provider name and current 
             billing data
         """
-        provider_name = provider['name']
         logger.info(f"Processing provider: {provider_name}")
 
         # 检查当前小时是否已有数据
@@ -153,23 +269,23 @@ class BillingMonitor:
 
         try:
             # 如果没有当前小时的数据，获取新数据
-            config_dict = ConfigParser.parse(provider['config'])
+            config_dict = ConfigParser.parse(config_str)
             msg = f"No current hour data found, fetching new data for {provider_name}"
             logger.info(msg)
 
-            # Load environment variables from config
-            for key, value in config_dict.items():
-                if value:  # Only set non-empty values
-                    os.environ[key] = str(value)
-                    logger.info("Set environment variable: %s=***", key)
+            # Pass settings to the provider directly instead of mutating
+            # the process environment, which is shared between threads
+            provider_config = ProviderFactory.config_from_env_vars(
+                provider_type, config_dict
+            )
 
             # Create billing service and get current billing
             billing_service = BillingService(
-                provider_name=provider['provider']
+                provider_name=provider_type,
+                config=provider_config
             )
-            current_month = datetime.now().strftime("%Y-%m")
             billing_info = billing_service.get_billing_info(
-                period=current_month
+                period=self._current_month
             )
             result = billing_info
 
@@ -220,7 +336,14 @@ class BillingMonitor:
         msg = f"current_cost: {current_cost}, previous_cost: {previous_cost}"
         logger.info(msg)
         
-        if previous_cost > 0:
+        # Skip missing or non-finite costs to avoid false alerts
+        if (
+            previous_cost is not None and
+            current_cost is not None and
+            math.isfinite(previous_cost) and
+            math.isfinite(current_cost) and
+            previous_cost > 0
+        ):
             increase_cost = current_cost - previous_cost
             increase_percent = increase_cost / previous_cost * 100
             msg = f"increase: {increase_cost} {increase_percent}"
@@ -242,35 +365,87 @@ class BillingMonitor:
         return None
 
     def _send_alerts(self, alert_message: str):
-        """Send alerts if billing exceeds threshold.
+        """Send all alerts of a run in a single webhook request.
 
         Args:
-            alert_data (Dict[str, Any]): Alert data
+            alert_message (str): Aggregated alert message
         """
+        if self._alert_service is None:
+            return
+
         try:
-            alert_service = AlertService(self.webhook_url)
-            alert_service.send_alert(alert_message=alert_message)
+            self._alert_service.send_alert(alert_message=alert_message)
         except Exception as e:
             logger.error(f"Failed to send alert: {str(e)}")
             logger.exception(e)
 
     def run(self):
         """Run billing monitor."""
+        self._update_run_timestamps()
+        self._file_cache.clear()
         try:
-            # Read configuration
+            # Read configuration, binding the used columns by index
             with open(self.config_file, 'r') as f:
-                reader = csv.DictReader(f)
-                providers = list(reader)
+                reader = csv.reader(f)
+                headers = next(reader, None)
+                if not headers:
+                    logger.warning(
+                        "No providers configured in %s", self.config_file
+                    )
+                    return
+
+                index = {header: i for i, header in enumerate(headers)}
+                missing = [
+                    column for column in CONFIG_COLUMNS
+                    if column not in index
+                ]
+                if missing:
+                    logger.error(
+                        "Missing columns in %s: %s",
+                        self.config_file,
+                        ", ".join(missing)
+                    )
+                    return
+
+                columns = [index[column] for column in CONFIG_COLUMNS]
+                row_length = max(columns) + 1
+                providers = []
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < row_length:
+                        logger.error(
+                            "Skipping incomplete provider at %s line %d",
+                            self.config_file,
+                            reader.line_num
+                        )
+                        continue
+                    providers.append(tuple(row[i] for i in columns))
+
+            # Step 1: Fetch and save billing data of all providers
+            # concurrently, as each fetch blocks on a remote billing API
+            results = [None] * len(providers)
+            if providers:
+                max_workers = min(MAX_FETCH_WORKERS, len(providers))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self._fetch_and_save_billing,
+                            name,
+                            provider_type,
+                            config_str
+                        ): i
+                        for i, (name, _, provider_type, config_str)
+                        in enumerate(providers)
+                    }
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
 
             alerts = []
-            # Process each provider
-            for provider in providers:
-                display_name = provider['display_name']
-                # Step 1: Fetch and save billing data
-                provider_name, current_data = self._fetch_and_save_billing(
-                    provider
-                )
-                
+            # Process each provider in configuration order
+            for (_, display_name, _, _), result in zip(providers, results):
+                provider_name, current_data = result
+
                 # Step 2: Compare with previous billing
                 alert_data = self._compare_billing_data(
                     provider_name, 
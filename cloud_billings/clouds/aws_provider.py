@@ -3,23 +3,122 @@
 This module provides an implementation of the Cloud interface for AWS.
 """
 
+import functools
 import logging
-import os
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from typing import ClassVar, Dict, List, Optional, Any, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from .provider import BaseCloudProvider, BaseCloudConfig
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:
+    aioboto3 = None
+
+from .provider import (
+    DATACLASS_OPTIONS,
+    BaseCloudProvider,
+    BaseCloudConfig,
+    getenv,
+    getenv_int
+)
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of pooled connections per boto3 client
+MAX_POOL_CONNECTIONS = 50
+
+
+def _client_config_options(
+    timeout: int, max_retries: int
+) -> Dict[str, Any]:
+    """Get client options shared by synchronous and async clients.
+
+    Args:
+        timeout (int): Connect and read timeout in seconds
+        max_retries (int): Maximum number of retries for failed requests
 
-@dataclass
+    Returns:
+        Dict[str, Any]: Connection pool, timeout and retry options
+    """
+    return {
+        'max_pool_connections': MAX_POOL_CONNECTIONS,
+        'connect_timeout': timeout,
+        'read_timeout': timeout,
+        'retries': {
+            'max_attempts': max_retries,
+            'mode': 'adaptive'
+        }
+    }
+
+
+def _build_client_config(timeout: int, max_retries: int) -> Config:
+    """Build botocore configuration for AWS clients.
+
+    Args:
+        timeout (int): Connect and read timeout in seconds
+        max_retries (int): Maximum number of retries for failed requests
+
+    Returns:
+        Config: Client configuration with connection pooling,
+            TCP keepalive, timeouts and retries
+    """
+    return Config(
+        tcp_keepalive=True,
+        **_client_config_options(timeout, max_retries)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_client(
+    service_name: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    timeout: int,
+    max_retries: int,
+    session_token: Optional[str] = None
+):
+    """Get a boto3 client shared by all providers with the same settings.
+
+    boto3 clients are thread safe, so one client and its connection pool
+    can serve every provider instance using the same credentials. A new
+    session is used per client because the default boto3 session is not
+    safe to create clients from concurrently.
+
+    Args:
+        service_name (str): AWS service name, e.g. ce or sts
+        access_key (str): AWS access key
+        secret_key (str): AWS secret key
+        region (str): AWS region
+        timeout (int): Request timeout in seconds
+        max_retries (int): Maximum number of retries for failed requests
+        session_token (Optional[str]): Session token of temporary
+            credentials
+
+    Returns:
+        Any: boto3 client for the service
+    """
+    logger.debug("Creating new AWS %s client", service_name)
+    return boto3.session.Session().client(
+        service_name,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=session_token,
+        region_name=region,
+        config=_build_client_config(timeout, max_retries)
+    )
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class AWSConfig(BaseCloudConfig):
     """AWS cloud provider configuration.
 
@@ -30,6 +129,8 @@ class AWSConfig(BaseCloudConfig):
     Environment Variables:
         AWS_ACCESS_KEY_ID: AWS access key
         AWS_SECRET_ACCESS_KEY: AWS secret key
+        AWS_SESSION_TOKEN: Session token of temporary credentials
+            (optional)
         AWS_REGION: AWS region
         AWS_TIMEOUT: Request timeout in seconds
         AWS_MAX_RETRIES: Maximum number of retries for failed requests
@@ -39,19 +140,32 @@ class AWSConfig(BaseCloudConfig):
     region: str = "cn-north-1"  # Default region
     timeout: int = 30
     max_retries: int = 3
+    session_token: Optional[str] = None
+
+    ENV_VARS: ClassVar[Dict[str, str]] = {
+        "AWS_ACCESS_KEY_ID": "api_key",
+        "AWS_SECRET_ACCESS_KEY": "api_secret",
+        "AWS_SESSION_TOKEN": "session_token",
+        "AWS_REGION": "region",
+        "AWS_TIMEOUT": "timeout",
+        "AWS_MAX_RETRIES": "max_retries",
+    }
 
     def __post_init__(self):
         """Initialize configuration from environment variables if not set."""
+        # The session token belongs to the access key it was issued with
+        if self.session_token is None and self.api_key is None:
+            self.session_token = getenv("AWS_SESSION_TOKEN")
         if self.api_key is None:
-            self.api_key = os.getenv("AWS_ACCESS_KEY_ID")
+            self.api_key = getenv("AWS_ACCESS_KEY_ID")
         if self.api_secret is None:
-            self.api_secret = os.getenv("AWS_SECRET_ACCESS_KEY")
+            self.api_secret = getenv("AWS_SECRET_ACCESS_KEY")
         if self.region is None:
-            self.region = os.getenv("AWS_REGION", "cn-north-1")
+            self.region = getenv("AWS_REGION", "cn-north-1")
         if self.timeout == 30:
-            self.timeout = int(os.getenv("AWS_TIMEOUT", "30"))
+            self.timeout = getenv_int("AWS_TIMEOUT", 30)
         if self.max_retries == 3:
-            self.max_retries = int(os.getenv("AWS_MAX_RETRIES", "3"))
+            self.max_retries = getenv_int("AWS_MAX_RETRIES", 3)
 
         self._validate_config()
 
@@ -99,83 +213,45 @@ class AWSCloud(BaseCloudProvider):
             ValueError: If configuration is invalid
         """
         super().__init__(config)
-        self._client = None
-        self._sts_client = None
+        # Account ID never changes for a given access key
+        self._account_id: Optional[str] = None
+        # Async clients, bound to the event loop they were created in
+        self._aio_session = None
+        self._aio_clients: Dict[str, Any] = {}
+        self._aio_exit_stack: Optional[contextlib.AsyncExitStack] = None
+        self._aio_lock: Optional[asyncio.Lock] = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
         self.name = "aws"
-        logger.info(f"Initialized AWS Cloud provider with config: {config}")
+        logger.info("Initialized AWS Cloud provider with config: %s", config)
 
-    @property
-    def client(self):
-        """Get AWS Cost Explorer client."""
-        if self._client is None:
-            self._client = boto3.client(
-                'ce',
-                aws_access_key_id=self.config.api_key,
-                aws_secret_access_key=self.config.api_secret,
-                region_name=self.config.region
-            )
-        return self._client
-
-    @property
-    def sts_client(self):
-        """Get AWS STS client."""
-        if self._sts_client is None:
-            self._sts_client = boto3.client(
-                'sts',
-                aws_access_key_id=self.config.api_key,
-                aws_secret_access_key=self.config.api_secret,
-                region_name=self.config.region
-            )
-        return self._sts_client
-
-    def _validate_period(self, period: Optional[str]) -> str:
-        """Validate and return the billing period.
+    def _get_client(self, service_name: str):
+        """Get a cached boto3 client for this provider's credentials.
 
         Args:
-            period (Optional[str]): Period in YYYY-MM format
+            service_name (str): AWS service name, e.g. ce or sts
 
         Returns:
-            str: Validated period
-
-        Raises:
-            ValueError: If period format is invalid
+            Any: boto3 client for the service
         """
-        if period is None:
-            period = datetime.now().strftime("%Y-%m")
-
-        logger.info(f"Getting billing info for period: {period}")
-
-        try:
-            year, month = map(int, period.split("-"))
-            if not (1 <= month <= 12):
-                raise ValueError("Month must be between 1 and 12")
-        except ValueError as e:
-            raise ValueError(f"Invalid period format: {str(e)}")
-
-        return period
-
-    def _get_period_dates(self, period: str) -> Tuple[str, str]:
-        """Get start and end dates for the billing period.
-
-        Args:
-            period (str): Period in YYYY-MM format
-
-        Returns:
-            Tuple[str, str]: Start and end dates in YYYY-MM-DD format
-        """
-        year, month = map(int, period.split("-"))
-        if month == 12:
-            next_month = 1
-            next_year = year + 1
-        else:
-            next_month = month + 1
-            next_year = year
+        return _get_client(
+            service_name,
+            self.config.api_key,
+            self.config.api_secret,
+            self.config.region,
+            self.config.timeout,
+            self.config.max_retries,
+            self.config.session_token
+        )
 
-        last_day = (
-            datetime(next_year, next_month, 1) - timedelta(days=1)
-        ).day
+    @property
+    def client(self):
+        """Get AWS Cost Explorer client."""
+        return self._get_client('ce')
 
-        return f"{period}-01", f"{period}-{last_day:02d}"
+    @property
+    def sts_client(self):
+        """Get AWS STS client."""
+        return self._get_client('sts')
 
     def _query_billing_api(
         self, start_date: str, end_date: str
@@ -190,8 +266,9 @@ class AWSCloud(BaseCloudProvider):
             Dict[str, Any]: API response containing cost and usage data
         """
         logger.debug(
-            f"Using AWS configuration: region={self.config.region}, "
-            f"access_key={self.config.api_key[:4]}***"
+            "Using AWS configuration: region=%s, access_key=%s***",
+            self.config.region,
+            self.config.api_key[:4]
         )
 
         response = self.client.get_cost_and_usage(
@@ -203,7 +280,7 @@ class AWSCloud(BaseCloudProvider):
             Metrics=['UnblendedCost']
         )
 
-        logger.debug(f"Received response: {response}")
+        logger.debug("Received response: %s", response)
         return response
 
     def _calculate_total_cost(
@@ -221,9 +298,7 @@ class AWSCloud(BaseCloudProvider):
         total_cost = float(result['Amount'])
         currency = result['Unit']
 
-        logger.debug(
-            f"Calculated total cost: {total_cost} {currency}"
-        )
+        logger.debug("Calculated total cost: %s %s", total_cost, currency)
 
         return total_cost, currency
 
@@ -254,62 +329,306 @@ class AWSCloud(BaseCloudProvider):
             period = self._validate_period(period)
 
             # Get period dates
-            start_date, end_date = self._get_period_dates(period)
+            start_date, end_date = self._period_to_date_range(period)
+
+            if self._account_id is not None:
+                # Account ID is cached, only the billing API is queried
+                response = self._query_billing_api(start_date, end_date)
+                account_id = self._account_id
+            else:
+                # Query billing API and account ID concurrently, both
+                # clients share the pooled connections
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    response_future = executor.submit(
+                        self._query_billing_api, start_date, end_date
+                    )
+                    account_id_future = executor.submit(
+                        self.get_account_id
+                    )
+                    response = response_future.result()
+                    account_id = account_id_future.result()
+
+            return self._build_billing_result(response, account_id)
 
-            # Query billing API
-            response = self._query_billing_api(start_date, end_date)
+        except ClientError as e:
+            return self._client_error_result(e)
+        except Exception as e:
+            return self._unexpected_error_result(e)
 
-            # Calculate total cost
-            total_cost, currency = self._calculate_total_cost(response)
+    def get_billing_info_batch(
+        self, periods: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get AWS billing information for several periods at once.
 
-            # Get account ID
-            account_id = self.get_account_id()
+        Cost Explorer returns one result per month for a date range, so
+        all periods are fetched with a single request.
 
-            # Build response data
-            data = {
-                "total_cost": total_cost,
-                "currency": currency,
-                "account_id": account_id
-            }
+        Args:
+            periods (List[str]): Periods in YYYY-MM format
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Billing information in the same
+                format as get_billing_info, keyed by period
+        """
+        # Validate each period separately, invalid ones get their own
+        # error. Results are keyed by the requested period, in order
+        billing_info: Dict[str, Dict[str, Any]] = dict.fromkeys(periods)
+        valid_periods = {}
+        for period in periods:
+            try:
+                valid_periods[period] = self._validate_period(period)
+            except ValueError as e:
+                logger.error("Skipping invalid period: %s", e)
+                billing_info[period] = {
+                    "status": "error",
+                    "data": None,
+                    "error": str(e)
+                }
+
+        if not valid_periods:
+            return billing_info
 
-            logger.info(f"AWS billing data: {data}")
+        try:
+            # Span all valid periods with one date range
+            start_date = self._period_to_date_range(
+                min(valid_periods.values())
+            )[0]
+            end_date = self._period_to_date_range(
+                max(valid_periods.values())
+            )[1]
+
+            response = self._query_billing_api(start_date, end_date)
+            account_id = self.get_account_id()
 
-            return {
-                "status": "success",
-                "data": data,
-                "error": None
+            # Monthly results are keyed by the start of their month
+            results_by_period = {
+                result['TimePeriod']['Start'][:7]: result
+                for result in response['ResultsByTime']
             }
 
+            for period, month in valid_periods.items():
+                result = results_by_period.get(month)
+                if result is None:
+                    billing_info[period] = {
+                        "status": "error",
+                        "data": None,
+                        "error": f"No billing data returned for {month}"
+                    }
+                else:
+                    billing_info[period] = self._build_billing_result(
+                        {'ResultsByTime': [result]}, account_id
+                    )
+            return billing_info
+
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_message = e.response['Error']['Message']
-            logger.error(
-                f"AWS API Error: {error_code} - {error_message}\n"
-                f"Region: {self.config.region}\n"
-                f"Access Key: {self.config.api_key[:4]}***"
+            error_result = self._client_error_result(e)
+        except Exception as e:
+            error_result = self._unexpected_error_result(e)
+
+        for period in valid_periods:
+            billing_info[period] = error_result
+        return billing_info
+
+    async def _get_async_client(self, service_name: str):
+        """Get a cached aioboto3 client for this provider's credentials.
+
+        Clients are kept open so their connection pool is reused across
+        calls. They are bound to the event loop they were created in and
+        must be closed with aclose() before another loop can use them.
+
+        Args:
+            service_name (str): AWS service name, e.g. ce or sts
+
+        Returns:
+            Any: aioboto3 client for the service
+
+        Raises:
+            RuntimeError: If the clients belong to another event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_loop is None:
+            self._aio_exit_stack = contextlib.AsyncExitStack()
+            self._aio_lock = asyncio.Lock()
+            self._aio_loop = loop
+        elif self._aio_loop is not loop:
+            raise RuntimeError(
+                "Async AWS clients belong to another event loop, call "
+                "aclose() in that loop before using this provider"
             )
 
-            if error_code == 'UnrecognizedClientException':
-                logger.error(
-                    "Possible causes:\n"
-                    "1. Invalid or expired AWS credentials\n"
-                    "2. Mismatch between credentials and region "
-                    "(global vs China)\n"
-                    "3. Missing required permissions for Cost Explorer API"
+        # Concurrent first calls create each client only once
+        async with self._aio_lock:
+            client = self._aio_clients.get(service_name)
+            if client is None:
+                if self._aio_session is None:
+                    self._aio_session = aioboto3.Session(
+                        aws_access_key_id=self.config.api_key,
+                        aws_secret_access_key=self.config.api_secret,
+                        aws_session_token=self.config.session_token,
+                        region_name=self.config.region
+                    )
+                config = AioConfig(
+                    tcp_keepalive=True,
+                    **_client_config_options(
+                        self.config.timeout, self.config.max_retries
+                    )
+                )
+                logger.debug(
+                    "Creating new async AWS %s client", service_name
+                )
+                client = await self._aio_exit_stack.enter_async_context(
+                    self._aio_session.client(service_name, config=config)
                 )
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"AWS API Error: {error_code} - {error_message}"
+                self._aio_clients[service_name] = client
+            return client
+
+    async def aget_billing_info(
+        self, period: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get AWS billing information without blocking the event loop.
+
+        Uses aioboto3 when it is installed, otherwise falls back to
+        running get_billing_info in the default executor.
+
+        Args:
+            period (Optional[str]): Period in YYYY-MM format. Defaults to
+                current month if not specified.
+
+        Returns:
+            Dict[str, Any]: Billing information in the same format as
+                get_billing_info
+        """
+        if aioboto3 is None:
+            return await super().aget_billing_info(period)
+
+        try:
+            # Validate and get billing period
+            period = self._validate_period(period)
+
+            # Get period dates
+            start_date, end_date = self._period_to_date_range(period)
+
+            time_period = {
+                'Start': start_date,
+                'End': end_date
             }
+            ce_client = await self._get_async_client('ce')
+
+            if self._account_id is not None:
+                # Account ID is cached, only the billing API is queried
+                response = await ce_client.get_cost_and_usage(
+                    TimePeriod=time_period,
+                    Granularity='MONTHLY',
+                    Metrics=['UnblendedCost']
+                )
+            else:
+                # Query billing API and account ID concurrently, both
+                # clients are created before any request is started
+                sts_client = await self._get_async_client('sts')
+                response, identity = await asyncio.gather(
+                    ce_client.get_cost_and_usage(
+                        TimePeriod=time_period,
+                        Granularity='MONTHLY',
+                        Metrics=['UnblendedCost']
+                    ),
+                    sts_client.get_caller_identity()
+                )
+                self._account_id = identity['Account']
+
+            return self._build_billing_result(response, self._account_id)
+
+        except ClientError as e:
+            return self._client_error_result(e)
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            logger.exception(e)
-            return {
-                "status": "error",
-                "data": None,
-                "error": str(e)
-            }
+            return self._unexpected_error_result(e)
+
+    async def aclose(self):
+        """Close the cached async clients if they were created."""
+        if self._aio_exit_stack is not None:
+            await self._aio_exit_stack.aclose()
+        self._aio_clients = {}
+        self._aio_exit_stack = None
+        self._aio_lock = None
+        self._aio_loop = None
+
+    def _build_billing_result(
+        self, response: Dict[str, Any], account_id: str
+    ) -> Dict[str, Any]:
+        """Build a successful billing result from a Cost Explorer response.
+
+        Args:
+            response (Dict[str, Any]): Cost Explorer API response
+            account_id (str): AWS account ID
+
+        Returns:
+            Dict[str, Any]: Successful billing information
+        """
+        # Calculate total cost
+        total_cost, currency = self._calculate_total_cost(response)
+
+        # Build response data
+        data = {
+            "total_cost": total_cost,
+            "currency": currency,
+            "account_id": account_id
+        }
+
+        logger.info("AWS billing data: %s", data)
+
+        return {
+            "status": "success",
+            "data": data,
+            "error": None
+        }
+
+    def _client_error_result(self, e: ClientError) -> Dict[str, Any]:
+        """Log an AWS API error and build the error result.
+
+        Args:
+            e (ClientError): AWS API error
+
+        Returns:
+            Dict[str, Any]: Failed billing information
+        """
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+        logger.error(
+            "AWS API Error: %s - %s\nRegion: %s\nAccess Key: %s***",
+            error_code,
+            error_message,
+            self.config.region,
+            self.config.api_key[:4]
+        )
+
+        if error_code == 'UnrecognizedClientException':
+            logger.error(
+                "Possible causes:\n"
+                "1. Invalid or expired AWS credentials\n"
+                "2. Mismatch between credentials and region "
+                "(global vs China)\n"
+                "3. Missing required permissions for Cost Explorer API"
+            )
+        return {
+            "status": "error",
+            "data": None,
+            "error": f"AWS API Error: {error_code} - {error_message}"
+        }
+
+    def _unexpected_error_result(self, e: Exception) -> Dict[str, Any]:
+        """Log an unexpected error and build the error result.
+
+        Args:
+            e (Exception): Unexpected error
+
+        Returns:
+            Dict[str, Any]: Failed billing information
+        """
+        logger.exception("Unexpected error: %s", e)
+        return {
+            "status": "error",
+            "data": None,
+            "error": str(e)
+        }
 
     def get_account_id(self) -> str:
         """Get AWS account ID.
@@ -320,12 +639,15 @@ class AWSCloud(BaseCloudProvider):
         Raises:
             Exception: If the account ID cannot be retrieved
         """
+        if self._account_id is not None:
+            return self._account_id
+
         try:
             response = self.sts_client.get_caller_identity()
-            return response['Account']
+            self._account_id = response['Account']
+            return self._account_id
         except Exception as e:
-            logger.error(f"Failed to get AWS account ID: {str(e)}")
-            logger.exception(e)
+            logger.exception("Failed to get AWS account ID: %s", e)
             raise
 
     def validate_credentials(self) -> bool:
@@ -338,6 +660,5 @@ class AWSCloud(BaseCloudProvider):
             self.sts_client.get_caller_identity()
             return True
         except Exception as e:
-            logger.error(f"Failed to validate AWS credentials: {str(e)}")
-            logger.exception(e)
+            logger.exception("Failed to validate AWS credentials: %s", e)
             return False
\ No newline at end of file
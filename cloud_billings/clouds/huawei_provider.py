@@ -3,33 +3,105 @@
 This module provides an implementation of the Cloud interface for Huawei Cloud.
 """
 
+import functools
 import logging
-import os
+import math
 from dataclasses import dataclass
-from typing import Dict, Optional, Any, List, Tuple
-from datetime import datetime
+from typing import ClassVar, Dict, Optional, Any, List, Tuple
 
 from huaweicloudsdkcore.auth.credentials import GlobalCredentials
+from huaweicloudsdkcore.http.http_config import HttpConfig
 from huaweicloudsdkbssintl.v2 import BssintlClient
 from huaweicloudsdkbssintl.v2.region.bssintl_region import BssintlRegion
 from huaweicloudsdkbss.v2 import BssClient
 from huaweicloudsdkbss.v2.region.bss_region import BssRegion
 from huaweicloudsdkbssintl.v2.model import (
-    ListMonthlyExpendituresRequest
+    ListMonthlyExpendituresRequest,
+    ShowCustomerAccountBalancesRequest as IntlAccountBalancesRequest
 )
 from huaweicloudsdkbss.v2.model import (
+    ShowCustomerAccountBalancesRequest,
     ShowCustomerMonthlySumRequest
 )
 from huaweicloudsdkcore.exceptions import exceptions
 
-from .provider import BaseCloudProvider, BaseCloudConfig
+from .provider import (
+    DATACLASS_OPTIONS,
+    BaseCloudProvider,
+    BaseCloudConfig,
+    getenv,
+    getenv_int
+)
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# HTTP status codes returned for rejected credentials
+_AUTH_ERROR_STATUS_CODES = (401, 403)
+
+# Maximum number of pooled connections per BSS client
+MAX_POOL_CONNECTIONS = 50
+
+# Divisors converting bill amounts to yuan by measure_id
+# (1: yuan, 3: fen), unknown units are kept as is
+_MEASURE_DIVISORS = {1: 1, 3: 100}
+
 
-@dataclass
+def _build_http_config(timeout: int) -> HttpConfig:
+    """Build HTTP configuration for BSS clients.
+
+    Args:
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        HttpConfig: HTTP configuration with a larger keep-alive pool
+    """
+    http_config = HttpConfig.get_default_config()
+    http_config.timeout = timeout
+    http_config.pool_connections = MAX_POOL_CONNECTIONS
+    http_config.pool_maxsize = MAX_POOL_CONNECTIONS
+    return http_config
+
+
+@functools.lru_cache(maxsize=32)
+def _get_bss_client(
+    api_key: str,
+    api_secret: str,
+    region: str,
+    is_international: bool,
+    timeout: int
+):
+    """Get a BSS client shared by all providers with the same settings.
+
+    Args:
+        api_key (str): Huawei access key
+        api_secret (str): Huawei secret key
+        region (str): Huawei region
+        is_international (bool): Whether to use the international site
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        Any: BssClient or BssintlClient instance
+    """
+    logger.debug("Creating new Huawei BSS client")
+    credentials = GlobalCredentials(api_key, api_secret)
+    http_config = _build_http_config(timeout)
+    if is_international:
+        return BssintlClient.new_builder() \
+            .with_http_config(http_config) \
+            .with_credentials(credentials) \
+            .with_region(BssintlRegion.value_of(region)) \
+            .build()
+
+    return BssClient.new_builder() \
+        .with_http_config(http_config) \
+        .with_credentials(credentials) \
+        .with_region(BssRegion.value_of(region)) \
+        .build()
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class HuaweiConfig(BaseCloudConfig):
     """Huawei cloud provider configuration.
 
@@ -52,22 +124,32 @@ class HuaweiConfig(BaseCloudConfig):
     max_retries: int = 3
     is_international: bool = False
 
+    ENV_VARS: ClassVar[Dict[str, str]] = {
+        "HUAWEI_ACCESS_KEY_ID": "api_key",
+        "HUAWEI_SECRET_ACCESS_KEY": "api_secret",
+        "HUAWEI_REGION": "region",
+        "HUAWEI_PROJECT_ID": "project_id",
+        "HUAWEI_TIMEOUT": "timeout",
+        "HUAWEI_MAX_RETRIES": "max_retries",
+        "HUAWEI_IS_INTERNATIONAL": "is_international",
+    }
+
     def __post_init__(self):
         """Initialize configuration from environment variables if not set."""
         if self.api_key is None:
-            self.api_key = os.getenv("HUAWEI_ACCESS_KEY_ID")
+            self.api_key = getenv("HUAWEI_ACCESS_KEY_ID")
         if self.api_secret is None:
-            self.api_secret = os.getenv("HUAWEI_SECRET_ACCESS_KEY")
+            self.api_secret = getenv("HUAWEI_SECRET_ACCESS_KEY")
         if self.region is None:
-            self.region = os.getenv("HUAWEI_REGION", "cn-north-1")
+            self.region = getenv("HUAWEI_REGION", "cn-north-1")
         if self.project_id is None:
-            self.project_id = os.getenv("HUAWEI_PROJECT_ID")
+            self.project_id = getenv("HUAWEI_PROJECT_ID")
         if self.timeout == 30:
-            self.timeout = int(os.getenv("HUAWEI_TIMEOUT", "30"))
+            self.timeout = getenv_int("HUAWEI_TIMEOUT", 30)
         if self.max_retries == 3:
-            self.max_retries = int(os.getenv("HUAWEI_MAX_RETRIES", "3"))
+            self.max_retries = getenv_int("HUAWEI_MAX_RETRIES", 3)
         if not self.is_international:
-            self.is_international = os.getenv(
+            self.is_international = getenv(
                 "HUAWEI_IS_INTERNATIONAL", "false"
             ).lower() == "true"
 
@@ -117,70 +199,21 @@ class HuaweiCloud(BaseCloudProvider):
             ValueError: If configuration is invalid
         """
         super().__init__(config)
-        self._client = None
         self.name = "huawei"
-        logger.info(f"Initialized Huawei Cloud provider with config: {config}")
+        logger.info(
+            "Initialized Huawei Cloud provider with config: %s", config
+        )
 
     @property
     def client(self):
         """Get Huawei BSS client."""
-        if self._client is None:
-            logger.debug("Creating new Huawei BSS client")
-            credentials = GlobalCredentials(
-                self.config.api_key,
-                self.config.api_secret
-            )
-            if self.config.is_international:
-                self._client = BssintlClient.new_builder() \
-                    .with_credentials(credentials) \
-                    .with_region(BssintlRegion.value_of(self.config.region)) \
-                    .build()
-            else:
-                self._client = BssClient.new_builder() \
-                    .with_credentials(credentials) \
-                    .with_region(BssRegion.value_of(self.config.region)) \
-                    .build()
-        return self._client
-
-    def _convert_amount(self, amount: float, measure_id: int) -> float:
-        """Convert amount based on measure_id.
-
-        Args:
-            amount (float): Original amount
-            measure_id (int): Amount unit (1: yuan, 3: fen)
-
-        Returns:
-            float: Converted amount in yuan
-        """
-        if measure_id == 3:  # fen to yuan
-            return amount / 100
-        return amount
-
-    def _validate_period(self, period: Optional[str]) -> str:
-        """Validate and return the billing period.
-
-        Args:
-            period (Optional[str]): Period in YYYY-MM format
-
-        Returns:
-            str: Validated period
-
-        Raises:
-            ValueError: If period format is invalid
-        """
-        if period is None:
-            period = datetime.now().strftime("%Y-%m")
-
-        logger.info(f"Getting billing info for period: {period}")
-
-        try:
-            year, month = map(int, period.split("-"))
-            if not (1 <= month <= 12):
-                raise ValueError("Month must be between 1 and 12")
-        except ValueError as e:
-            raise ValueError(f"Invalid period format: {str(e)}")
-
-        return period
+        return _get_bss_client(
+            self.config.api_key,
+            self.config.api_secret,
+            self.config.region,
+            self.config.is_international,
+            self.config.timeout
+        )
 
     def _query_billing_api(self, period: str) -> Any:
         """Query the Huawei billing API.
@@ -195,8 +228,9 @@ class HuaweiCloud(BaseCloudProvider):
             exceptions.ClientRequestException: If API request fails
         """
         logger.debug(
-            f"Using Huawei configuration: region={self.config.region}, "
-            f"project_id={self.config.project_id}"
+            "Using Huawei configuration: region=%s, project_id=%s",
+            self.config.region,
+            self.config.project_id
         )
 
         if self.config.is_international:
@@ -206,7 +240,7 @@ class HuaweiCloud(BaseCloudProvider):
             request = ShowCustomerMonthlySumRequest()
             request.bill_cycle = period
 
-        logger.debug(f"Prepared request: {request}")
+        logger.debug("Prepared request: %s", request)
         logger.info("Sending request to Huawei BSS API")
 
         if self.config.is_international:
@@ -214,11 +248,7 @@ class HuaweiCloud(BaseCloudProvider):
         else:
             response = self.client.show_customer_monthly_sum(request)
 
-        logger.debug(f"Received response: {response}")
-
-        if not hasattr(response, 'bill_sums'):
-            raise ValueError("Invalid response format: missing bill_sums")
-
+        logger.debug("Received response: %s", response)
         return response
 
     def _calculate_total_cost(
@@ -231,38 +261,39 @@ class HuaweiCloud(BaseCloudProvider):
 
         Returns:
             Tuple[float, str, List[Dict]]: Total cost, currency, and item details
+
+        Raises:
+            ValueError: If the response has no bill_sums
         """
+        bills = getattr(response, 'bill_sums', None)
+        if bills is None:
+            raise ValueError("Invalid response format: missing bill_sums")
+
         currency = getattr(response, 'currency', 'USD')
-        logger.debug(f"Currency from response: {currency}")
+        logger.debug("Currency from response: %s", currency)
 
-        total_cost = 0.0
+        # Build item details in a single pass, amounts are in yuan
         item_details = []
-
-        for bill in response.bill_sums:
+        for bill in bills:
             measure_id = getattr(bill, 'measure_id', 3)
-            amount = self._convert_amount(
-                float(bill.consume_amount), measure_id
-            )
-            total_cost += amount
-
-            service_type_name = getattr(
-                bill, 'service_type_name', 'Unknown'
-            )
-            resource_type_name = getattr(
-                bill, 'resource_type_name', 'Unknown'
-            )
-            service_name = f"{service_type_name} - {resource_type_name}"
-
+            divisor = _MEASURE_DIVISORS.get(measure_id, 1)
             item_details.append({
-                "service_name": service_name,
-                "amount": amount,
+                "service_name": (
+                    f"{getattr(bill, 'service_type_name', 'Unknown')} - "
+                    f"{getattr(bill, 'resource_type_name', 'Unknown')}"
+                ),
+                "amount": float(bill.consume_amount) / divisor,
                 "measure_id": measure_id
             })
 
-            logger.debug(
-                f"Processed bill: service={service_name}, "
-                f"amount={amount}, measure_id={measure_id}"
-            )
+        # fsum avoids drift when adding many small fen amounts
+        total_cost = math.fsum(item["amount"] for item in item_details)
+        logger.debug(
+            "Processed %d bills, total cost: %s %s",
+            len(item_details),
+            total_cost,
+            currency
+        )
 
         return total_cost, currency, item_details
 
@@ -309,7 +340,7 @@ class HuaweiCloud(BaseCloudProvider):
                 "items": item_details
             }
 
-            logger.info(f"Huawei billing data: {data}")
+            logger.info("Huawei billing data: %s", data)
 
             return {
                 "status": "success",
@@ -331,7 +362,7 @@ class HuaweiCloud(BaseCloudProvider):
             }
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Huawei API Error: {error_msg}")
+            logger.error("Huawei API Error: %s", error_msg)
             return {
                 "status": "error",
                 "data": None,
@@ -353,9 +384,26 @@ class HuaweiCloud(BaseCloudProvider):
             bool: True if credentials are valid, False otherwise
         """
         try:
-            # Try to get billing info for current month
-            result = self.get_billing_info()
-            return result["status"] == "success"
+            # Query account balances, the cheapest authenticated BSS call
+            if self.config.is_international:
+                self.client.show_customer_account_balances(
+                    IntlAccountBalancesRequest()
+                )
+            else:
+                self.client.show_customer_account_balances(
+                    ShowCustomerAccountBalancesRequest()
+                )
+            return True
+        except exceptions.ClientRequestException as e:
+            # Only authentication failures mean invalid credentials
+            if e.status_code in _AUTH_ERROR_STATUS_CODES:
+                logger.error(
+                    "Invalid Huawei credentials: %s - %s",
+                    e.error_code,
+                    e.error_msg
+                )
+                return False
+            return True
         except Exception as e:
-            logger.error(f"Failed to validate Huawei credentials: {str(e)}")
+            logger.error("Failed to validate Huawei credentials: %s", e)
             return False
\ No newline at end of file
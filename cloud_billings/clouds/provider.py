@@ -5,17 +5,100 @@ It defines the common interface that all cloud providers must implement,
 allowing for extensibility beyond just billing functionality.
 """
 
+import asyncio
+import functools
 import logging
+import os
+import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Billing period in YYYY-MM format
+_PERIOD_RE = re.compile(r'^(\d{4})-(0[1-9]|1[0-2])$')
 
-@dataclass
+# Options for config dataclasses, slots require Python 3.10+. The
+# generated repr is disabled in favour of BaseCloudConfig.__repr__,
+# which masks credentials
+DATACLASS_OPTIONS: Dict[str, Any] = {
+    "repr": False,
+    **({"slots": True} if sys.version_info >= (3, 10) else {})
+}
+
+# Configuration fields masked in logs
+SECRET_FIELDS = frozenset({"api_key", "api_secret", "session_token"})
+
+# Snapshot of the process environment, see reload_env()
+_ENV = dict(os.environ)
+
+
+def reload_env():
+    """Refresh the environment snapshot used by provider configs.
+
+    Configurations read environment variables from a snapshot taken at
+    import time. Call this after changing os.environ at runtime. Cached
+    providers are dropped as well, since their configuration may have
+    been filled in from the previous environment.
+    """
+    # Imported here, the service module imports the providers
+    from .service import _build_provider
+
+    global _ENV
+    _ENV = dict(os.environ)
+    getenv_int.cache_clear()
+    _build_provider.cache_clear()
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Get an environment variable from the snapshot.
+
+    Args:
+        name (str): Environment variable name
+        default (Optional[str]): Value returned if the variable is unset
+
+    Returns:
+        Optional[str]: Environment variable value
+    """
+    return _ENV.get(name, default)
+
+
+def redact_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Mask credentials in a configuration before it is logged.
+
+    Args:
+        config (Dict[str, Any]): Configuration values
+
+    Returns:
+        Dict[str, Any]: Copy of the configuration with credentials masked
+    """
+    return {
+        key: "***" if key in SECRET_FIELDS and value else value
+        for key, value in config.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def getenv_int(name: str, default: int) -> int:
+    """Get an integer environment variable, parsing it only once.
+
+    Args:
+        name (str): Environment variable name
+        default (int): Value returned if the variable is unset
+
+    Returns:
+        int: Environment variable value
+    """
+    value = _ENV.get(name)
+    return default if value is None else int(value)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class BaseCloudConfig:
     """Base configuration for cloud providers.
 
@@ -32,6 +115,63 @@ class BaseCloudConfig:
     timeout: int = 30
     max_retries: int = 3
 
+    # Mapping of environment variable names to configuration fields,
+    # overridden by each provider configuration
+    ENV_VARS: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def from_env_vars(cls, env_vars: Dict[str, str]) -> Dict[str, Any]:
+        """Convert environment variable style settings to config kwargs.
+
+        This allows settings such as ``AWS_ACCESS_KEY_ID=xxx`` to be
+        passed to the configuration directly instead of being exported
+        to the process environment.
+
+        Args:
+            env_vars (Dict[str, str]): Settings keyed by environment
+                variable name
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for the configuration class
+        """
+        field_types = {f.name: f.type for f in fields(cls)}
+        config = {}
+        for env_name, value in env_vars.items():
+            field_name = cls.ENV_VARS.get(env_name)
+            # Skip unknown settings and empty values
+            if field_name is None:
+                logger.warning(
+                    "Ignoring unsupported %s setting: %s",
+                    cls.__name__,
+                    env_name
+                )
+                continue
+            if not value:
+                continue
+
+            field_type = field_types[field_name]
+            if field_type is int:
+                config[field_name] = int(value)
+            elif field_type is bool:
+                config[field_name] = value.lower() == "true"
+            else:
+                config[field_name] = value
+        return config
+
+    def __repr__(self) -> str:
+        """Represent the configuration with credentials masked.
+
+        Returns:
+            str: Configuration representation safe to log
+        """
+        values = redact_config(
+            {f.name: getattr(self, f.name) for f in fields(self)}
+        )
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(f"{key}={value!r}" for key, value in values.items())
+        )
+
 
 class BaseCloudProvider(ABC):
     """Base class for cloud providers.
@@ -52,6 +192,53 @@ class BaseCloudProvider(ABC):
         """
         self.config = config
 
+    def _validate_period(self, period: Optional[str]) -> str:
+        """Validate and return the billing period.
+
+        Args:
+            period (Optional[str]): Period in YYYY-MM format
+
+        Returns:
+            str: Validated period
+
+        Raises:
+            ValueError: If period format is invalid
+        """
+        if period is None:
+            period = datetime.now().strftime("%Y-%m")
+
+        logger.info("Getting billing info for period: %s", period)
+
+        if not _PERIOD_RE.match(period):
+            raise ValueError(
+                f"Invalid period format: {period}, expected YYYY-MM"
+            )
+
+        return period
+
+    def _period_to_date_range(self, period: str) -> Tuple[str, str]:
+        """Get start and end dates for the billing period.
+
+        The end date is exclusive, i.e. the first day of the following
+        month, as expected by billing APIs such as AWS Cost Explorer.
+
+        Args:
+            period (str): Validated period in YYYY-MM format
+
+        Returns:
+            Tuple[str, str]: Start and exclusive end dates in YYYY-MM-DD
+                format
+        """
+        # Validated periods have a fixed layout, slice instead of split
+        year = int(period[:4])
+        month = int(period[5:7])
+        if month == 12:
+            year, month = year + 1, 1
+        else:
+            month += 1
+
+        return f"{period}-01", f"{year:04d}-{month:02d}-01"
+
     @abstractmethod
     def get_billing_info(
         self, period: Optional[str] = None
@@ -75,6 +262,55 @@ class BaseCloudProvider(ABC):
             "get_billing_info() method needs to be implemented"
         )
 
+    def get_billing_info_batch(
+        self, periods: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get billing information for several periods.
+
+        The default implementation queries each period separately,
+        providers whose API accepts a date range override it to fetch all
+        periods in one request.
+
+        Args:
+            periods (List[str]): Periods in YYYY-MM format
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Billing information in the same
+                format as get_billing_info, keyed by period
+        """
+        return {period: self.get_billing_info(period) for period in periods}
+
+    async def aget_billing_info(
+        self, period: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get billing information without blocking the event loop.
+
+        Providers without an asynchronous SDK run get_billing_info in the
+        default executor, so several providers can be queried
+        concurrently with asyncio.gather.
+
+        Args:
+            period (Optional[str]): Period in YYYY-MM format. Defaults to
+                current month if not specified.
+
+        Returns:
+            Dict[str, Any]: Billing information in the same format as
+                get_billing_info
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.get_billing_info, period)
+        )
+
+    async def aclose(self):
+        """Release resources held for asynchronous queries.
+
+        Providers created through ProviderFactory are shared between
+        billing services, close them all with service.aclose_providers()
+        instead of closing a single shared provider. Providers without
+        asynchronous clients have nothing to close.
+        """
+
     @abstractmethod
     def get_account_id(self) -> str:
         """Get the cloud provider account ID.
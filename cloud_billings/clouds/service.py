@@ -4,16 +4,21 @@ This module provides base classes for cloud services and a factory
 for creating cloud provider instances.
 """
 
+import functools
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from .aws_provider import AWSConfig, AWSCloud
 from .huawei_provider import HuaweiConfig, HuaweiCloud
+from .provider import redact_config
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Providers created by _build_provider, closed by aclose_providers()
+_PROVIDERS: List[Any] = []
+
 
 class ProviderFactory:
     """Factory for creating cloud provider instances."""
@@ -32,7 +37,7 @@ class ProviderFactory:
 
     @classmethod
     def create_provider(
-        cls, provider_name: str, config: Optional[Dict[str, Any]] = {}
+        cls, provider_name: str, config: Optional[Dict[str, Any]] = None
     ) -> Any:
         """Create a cloud provider instance.
 
@@ -49,16 +54,76 @@ class ProviderFactory:
         if provider_name not in cls.PROVIDER_MAPPING:
             raise ValueError(f"Unsupported provider: {provider_name}")
 
-        provider_info = cls.PROVIDER_MAPPING[provider_name]
-        config_class = provider_info['config_class']
-        provider_class = provider_info['provider_class']
+        # Reuse providers built with the same configuration
+        frozen_config = tuple(sorted((config or {}).items()))
+        return _build_provider(provider_name, frozen_config)
+
+    @classmethod
+    def config_from_env_vars(
+        cls, provider_name: str, env_vars: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Build provider configuration from environment style settings.
 
-        # Create provider instance with validated config
-        # Add fallback to empty dict if config is None
-        config = config or {}
-        logger.info(f"Creating provider instance with config: {config}")
-        provider_config = config_class(**config)
-        return provider_class(provider_config)
+        Args:
+            provider_name (str): Name of the cloud provider
+            env_vars (Dict[str, str]): Settings keyed by environment
+                variable name, e.g. AWS_ACCESS_KEY_ID
+
+        Returns:
+            Dict[str, Any]: Provider configuration
+
+        Raises:
+            ValueError: If provider name is not supported
+        """
+        if provider_name not in cls.PROVIDER_MAPPING:
+            raise ValueError(f"Unsupported provider: {provider_name}")
+
+        config_class = cls.PROVIDER_MAPPING[provider_name]['config_class']
+        return config_class.from_env_vars(env_vars)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_provider(
+    provider_name: str, frozen_config: Tuple[Tuple[str, Any], ...]
+) -> Any:
+    """Create a cloud provider instance, cached per configuration.
+
+    Args:
+        provider_name (str): Name of the cloud provider
+        frozen_config (Tuple[Tuple[str, Any], ...]): Sorted configuration
+            items
+
+    Returns:
+        Any: Cloud provider instance
+    """
+    provider_info = ProviderFactory.PROVIDER_MAPPING[provider_name]
+    config_class = provider_info['config_class']
+    provider_class = provider_info['provider_class']
+
+    # Create provider instance with validated config
+    config = dict(frozen_config)
+    logger.info(
+        "Creating provider instance with config: %s", redact_config(config)
+    )
+    provider_config = config_class(**config)
+    provider = provider_class(provider_config)
+    _PROVIDERS.append(provider)
+    return provider
+
+
+async def aclose_providers():
+    """Close the asynchronous clients of all providers and drop the cache.
+
+    Providers are shared by every BillingService built with the same
+    configuration, so their async clients can't be closed per service.
+    Call this once when asynchronous queries are done, e.g. at shutdown.
+    Services created afterwards get new providers.
+    """
+    providers = list(_PROVIDERS)
+    _PROVIDERS.clear()
+    _build_provider.cache_clear()
+    for provider in providers:
+        await provider.aclose()
 
 
 class BillingService:
@@ -85,4 +150,31 @@ class BillingService:
         Returns:
             Dict[str, Any]: Billing information
         """
-        return self.provider.get_billing_info(period=period)
\ No newline at end of file
+        return self.provider.get_billing_info(period=period)
+
+    def get_billing_info_batch(
+        self, periods: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get billing information for several periods.
+
+        Args:
+            periods (List[str]): Periods in YYYY-MM format
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Billing information keyed by period
+        """
+        return self.provider.get_billing_info_batch(periods)
+
+    async def aget_billing_info(
+        self, period: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get billing information without blocking the event loop.
+
+        Args:
+            period (Optional[str]): Period in YYYY-MM format. Defaults to
+                current month if not specified.
+
+        Returns:
+            Dict[str, Any]: Billing information
+        """
+        return await self.provider.aget_billing_info(period=period)
\ No newline at end of file
@@ -4,65 +4,166 @@ This module demonstrates how to use the cloud billing system to retrieve
 billing information from cloud providers.
 """
 
+import functools
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
 import os
+import sys
+from typing import TYPE_CHECKING, List, Optional
 
-from cloud_billings.clouds.service import BillingService
+from cloud_billings import _logging
+
+if TYPE_CHECKING:
+    from cloud_billings.clouds.service import BillingService
 
 
 # Configure logging
 def setup_logging():
     """Configure logging for the application."""
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # Records of this module propagate to the root handler
+    _logging.configure()
+
+
+# Logging is configured by the entry point, importing has no side effects
+logger = logging.getLogger(__name__)
+
+# Provider configurations, environment variables are read once
+_AWS_CONFIG = {
+    'api_key': os.getenv('AWS_ACCESS_KEY_ID'),
+    'api_secret': os.getenv('AWS_SECRET_ACCESS_KEY'),
+    'region': os.getenv('AWS_REGION', 'cn-north-1')
+}
+_HUAWEI_CONFIG = {
+    'api_key': os.getenv('ACCESS_KEY_ID'),
+    'api_secret': os.getenv('SECRET_ACCESS_KEY'),
+    'region': os.getenv('REGION', 'cn-north-1'),
+    'is_international': (
+        os.getenv('HUAWEI_IS_INTERNATIONAL', 'false').lower() == 'true'
     )
+}
+_CONFIGS = {
+    'aws': _AWS_CONFIG,
+    'huawei': _HUAWEI_CONFIG
+}
 
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+# Environment variables the provider configs fall back to for
+# credentials missing from the configurations above
+_CREDENTIAL_ENV_VARS = {
+    'aws': ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'),
+    'huawei': ('HUAWEI_ACCESS_KEY_ID', 'HUAWEI_SECRET_ACCESS_KEY')
+}
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
 
-    # Configure example logger
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
-    logger.addHandler(console_handler)
+def _has_credentials(provider: str, label: str) -> bool:
+    """Check that a provider has credentials before any request is made.
 
+    Args:
+        provider (str): Name of the cloud provider
+        label (str): Provider name shown in the output
 
-# Initialize logging
-setup_logging()
-logger = logging.getLogger(__name__)
+    Returns:
+        bool: True if both API key and secret are set, either in the
+            configuration or in the provider's environment variables
+    """
+    config = _CONFIGS[provider]
+    key_var, secret_var = _CREDENTIAL_ENV_VARS[provider]
+    if (
+        (config['api_key'] or os.getenv(key_var)) and
+        (config['api_secret'] or os.getenv(secret_var))
+    ):
+        return True
 
+    logger.error("%s credentials missing; skipping", label)
+    return False
 
-def test_aws_billing():
-    """Test AWS billing functionality."""
-    # Create AWS billing service with configuration
-    aws_config = {
-        'api_key': os.getenv('AWS_ACCESS_KEY_ID'),
-        'api_secret': os.getenv('AWS_SECRET_ACCESS_KEY'),
-        'region': os.getenv('AWS_REGION', 'cn-north-1')
-    }
 
-    billing_service = BillingService(
-        provider_name='aws',
-        config=aws_config
-    )
+@functools.lru_cache(maxsize=None)
+def _service(provider: str) -> "BillingService":
+    """Get the billing service of a provider, created once per process.
+
+    The service module pulls in the cloud SDKs, so it is imported on
+    first use rather than when this module is loaded.
+
+    Args:
+        provider (str): Name of the cloud provider
+
+    Returns:
+        BillingService: Billing service for the provider
+    """
+    from cloud_billings.clouds.service import BillingService
+
+    return BillingService(provider_name=provider, config=_CONFIGS[provider])
+
+
+@functools.lru_cache(maxsize=1)
+def _format_month(month_start: date) -> str:
+    """Format a month, cached until the month rolls over.
+
+    Args:
+        month_start (date): First day of the month
+
+    Returns:
+        str: Month in YYYY-MM format
+    """
+    return month_start.strftime("%Y-%m")
+
+
+def _current_month() -> str:
+    """Get the current month in YYYY-MM format.
+
+    Returns:
+        str: Current month
+    """
+    return _format_month(date.today().replace(day=1))
+
+
+def _recent_months(count: int) -> List[str]:
+    """Get the current and preceding months, oldest first.
+
+    Args:
+        count (int): Number of months
+
+    Returns:
+        List[str]: Months in YYYY-MM format
+    """
+    months = []
+    month_start = date.today().replace(day=1)
+    for _ in range(count):
+        months.append(month_start.strftime("%Y-%m"))
+        month_start = (month_start - timedelta(days=1)).replace(day=1)
+    return months[::-1]
+
+
+def test_aws_billing(period: Optional[str] = None):
+    """Test AWS billing functionality.
+
+    Args:
+        period (Optional[str]): Period in YYYY-MM format. Defaults to
+            current month if not specified.
+    """
+    if not _has_credentials('aws', 'AWS'):
+        return
+
+    # Get the shared AWS billing service
+    billing_service = _service('aws')
 
     # Get billing information for specific period
     try:
-        # Get current month's billing
-        current_month = datetime.now().strftime("%Y-%m")
+        # Default to current month's billing
+        current_month = period or _current_month()
         result = billing_service.get_billing_info(period=current_month)
 
         if result["status"] == "success":
-            data = result["data"]
-            logger.info(f"\nAWS Billing for {current_month}:")
-            logger.info(f"Total Cost: {data['total_cost']} {data['currency']}")
+            # Skip the lookups entirely when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                data = result["data"]
+                logger.info(
+                    "\nAWS Billing for %s:\nTotal Cost: %s %s",
+                    current_month,
+                    data['total_cost'],
+                    data['currency']
+                )
         else:
             logger.error(
                 "Failed to get AWS billing information: %s",
@@ -70,37 +171,38 @@ def test_aws_billing():
             )
 
     except Exception as e:
-        logger.error(f"An error occurred with AWS: {str(e)}")
-        logger.exception(e)
-
-
-def test_huawei_billing():
-    """Test Huawei Cloud billing functionality."""
-    # Create Huawei billing service with configuration
-    huawei_config = {
-        'api_key': os.getenv('ACCESS_KEY_ID'),
-        'api_secret': os.getenv('SECRET_ACCESS_KEY'),
-        'region': os.getenv('REGION', 'cn-north-1'),
-        'is_international': (
-            os.getenv('HUAWEI_IS_INTERNATIONAL', 'false').lower() == 'true'
-        )
-    }
+        logger.exception("An error occurred with AWS: %s", e)
 
-    billing_service = BillingService(
-        provider_name='huawei',
-        config=huawei_config
-    )
+
+def test_huawei_billing(period: Optional[str] = None):
+    """Test Huawei Cloud billing functionality.
+
+    Args:
+        period (Optional[str]): Period in YYYY-MM format. Defaults to
+            current month if not specified.
+    """
+    if not _has_credentials('huawei', 'Huawei Cloud'):
+        return
+
+    # Get the shared Huawei billing service
+    billing_service = _service('huawei')
 
     # Get billing information for specific period
     try:
-        # Get current month's billing
-        current_month = datetime.now().strftime("%Y-%m")
+        # Default to current month's billing
+        current_month = period or _current_month()
         result = billing_service.get_billing_info(period=current_month)
 
         if result["status"] == "success":
-            data = result["data"]
-            logger.info(f"\nHuawei Cloud Billing for {current_month}:")
-            logger.info(f"Total Cost: {data['total_cost']} {data['currency']}")
+            # Skip the lookups entirely when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                data = result["data"]
+                logger.info(
+                    "\nHuawei Cloud Billing for %s:\nTotal Cost: %s %s",
+                    current_month,
+                    data['total_cost'],
+                    data['currency']
+                )
         else:
             logger.error(
                 "Failed to get Huawei Cloud billing information: %s",
@@ -108,18 +210,74 @@ def test_huawei_billing():
             )
 
     except Exception as e:
-        logger.error(f"An error occurred with Huawei Cloud: {str(e)}")
-        logger.exception(e)
+        logger.exception("An error occurred with Huawei Cloud: %s", e)
+
+
+def test_billing_history(
+    provider: str, label: str, periods: Optional[List[str]] = None
+):
+    """Test fetching several months of billing in one batch.
+
+    Args:
+        provider (str): Name of the cloud provider
+        label (str): Provider name shown in the output
+        periods (Optional[List[str]]): Periods in YYYY-MM format.
+            Defaults to the last three months if not specified.
+    """
+    if not _has_credentials(provider, label):
+        return
+
+    try:
+        results = _service(provider).get_billing_info_batch(
+            periods or _recent_months(3)
+        )
+
+        for period, result in results.items():
+            if result["status"] == "success":
+                data = result["data"]
+                logger.info(
+                    "%s Billing for %s: %s %s",
+                    label,
+                    period,
+                    data['total_cost'],
+                    data['currency']
+                )
+            else:
+                logger.error(
+                    "Failed to get %s billing for %s: %s",
+                    label,
+                    period,
+                    result['error']
+                )
+
+    except Exception as e:
+        logger.exception("An error occurred with %s: %s", label, e)
 
 
 def main():
     """Main function demonstrating billing system usage."""
-    logger.info("Testing AWS billing...")
-    test_aws_billing()
+    # Both providers run concurrently, so a single banner covers them.
+    # Banners are plain output, they do not go through logging
+    print("Testing AWS and Huawei Cloud billing...", file=sys.stderr)
 
-    logger.info("\nTesting Huawei Cloud billing...")
-    test_huawei_billing()
+    # Both providers are queried for the same current month, earlier
+    # months are fetched in one batch per provider
+    period = _current_month()
+    history = _recent_months(3)[:-1]
 
+    # Query both providers concurrently, each call waits on the network
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(test_aws_billing, period),
+            executor.submit(test_huawei_billing, period),
+            executor.submit(test_billing_history, 'aws', 'AWS', history),
+            executor.submit(
+                test_billing_history, 'huawei', 'Huawei Cloud', history
+            )
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 if __name__ == "__main__":
+    setup_logging()
     main()
\ No newline at end of file
@@ -6,24 +6,48 @@ This script runs the cloud billing monitor to check costs and send alerts.
 import logging
 import argparse
 import os
-from cloud_billings.billings.monitor import BillingMonitor
+from cloud_billings import _logging
 
 
-def setup_logging():
-    """Configure logging for the application."""
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+logger = logging.getLogger(__name__)
 
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
+def setup_logging():
+    """Configure logging for the application."""
+    _logging.configure()
+
+
+# Argument parser built once at import time
+_PARSER = argparse.ArgumentParser(
+    description='Cloud billing monitor to check costs and send alerts'
+)
+_PARSER.add_argument(
+    '--config',
+    required=True,
+    help='Path to the configuration CSV file'
+)
+_PARSER.add_argument(
+    '--data-dir',
+    required=True,
+    help='Path to the data directory'
+)
+_PARSER.add_argument(
+    '--webhook-url',
+    required=False,
+    help='Webhook URL for alerts'
+)
+_PARSER.add_argument(
+    '--cost-threshold',
+    type=float,
+    default=10.0,
+    help='Cost threshold in current currency (default: 10.0)'
+)
+_PARSER.add_argument(
+    '--growth-threshold',
+    type=float,
+    default=5.0,
+    help='Growth threshold in percentage (default: 5.0)'
+)
 
 
 def parse_args():
@@ -32,37 +56,7 @@ def parse_args():
     Returns:
         argparse.Namespace: Parsed arguments
     """
-    parser = argparse.ArgumentParser(
-        description='Cloud billing monitor to check costs and send alerts'
-    )
-    parser.add_argument(
-        '--config',
-        required=True,
-        help='Path to the configuration CSV file'
-    )
-    parser.add_argument(
-        '--data-dir',
-        required=True,
-        help='Path to the data directory'
-    )
-    parser.add_argument(
-        '--webhook-url',
-        required=False,
-        help='Webhook URL for alerts'
-    )
-    parser.add_argument(
-        '--cost-threshold',
-        type=float,
-        default=10.0,
-        help='Cost threshold in current currency (default: 10.0)'
-    )
-    parser.add_argument(
-        '--growth-threshold',
-        type=float,
-        default=5.0,
-        help='Growth threshold in percentage (default: 5.0)'
-    )
-    return parser.parse_args()
+    return _PARSER.parse_args()
 
 
 def ensure_data_dir(data_dir: str):
@@ -71,17 +65,17 @@ def ensure_data_dir(data_dir: str):
     Args:
         data_dir (str): Path to the data directory
     """
-    if not os.path.exists(data_dir):
-        logger = logging.getLogger(__name__)
-        logger.info(f"Creating data directory: {data_dir}")
-        os.makedirs(data_dir, exist_ok=True)
+    try:
+        os.makedirs(data_dir)
+        logger.info("Created data directory: %s", data_dir)
+    except FileExistsError:
+        pass
 
 
 def main():
     """Run the billing monitor."""
     # Setup logging
     setup_logging()
-    logger = logging.getLogger(__name__)
 
     try:
         # Parse command line arguments
@@ -90,7 +84,9 @@ def main():
         # Ensure data directory exists
         ensure_data_dir(args.data_dir)
 
-        # Create and run monitor
+        # Create and run monitor, importing the cloud SDKs only now
+        from cloud_billings.billings.monitor import BillingMonitor
+
         monitor = BillingMonitor(args.config,
                                  args.data_dir,
                                  args.webhook_url,
@@ -99,7 +95,7 @@ def main():
         monitor.run()
 
     except Exception as e:
-        logger.error(f"Error running monitor: {str(e)}")
+        logger.error("Error running monitor: %s", e)
         raise
 
 